@@ -7,8 +7,8 @@ __author__ = "PyRush Team"
 
 # Import main classes for easy access
 from .models import RequestResult, TestConfig
-from .core import StressTester
+from .core import StressTester, setup_event_loop
 from .config import parse_duration
 from .cli import main
 
-__all__ = ['RequestResult', 'TestConfig', 'StressTester', 'parse_duration', 'main'] 
\ No newline at end of file
+__all__ = ['RequestResult', 'TestConfig', 'StressTester', 'setup_event_loop', 'parse_duration', 'main'] 
\ No newline at end of file
@@ -2,114 +2,315 @@
 Main entry point for PyRush stress testing application
 """
 
+import argparse
 import asyncio
+import dataclasses
 import os
-from datetime import datetime
-from .config import create_argument_parser, create_test_config_from_args, parse_duration
-from .core import StressTester
-from .reporter import export_csv, export_json, generate_pdf_report
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from .config import create_argument_parser, create_test_config_from_args, load_config_file, parse_duration
+from .core import StressTester, setup_event_loop
+
+# Output directory for reports; created once per process
+_REPORT_DIR = 'report_files'
+_REPORT_DIR_READY = False
+
+def _split_evenly(total: int, parts: int, index: int) -> int:
+    """Return the share of total assigned to part number index"""
+    return total // parts + (1 if index < total % parts else 0)
+
+def _run_test_partition(config, urls: list, loop: str, index: int) -> StressTester:
+    """
+    Run one slice of a multi-process test inside a worker process
+    
+    Returns:
+        The finished StressTester, pickled back to the parent process
+    """
+    tester = StressTester(config, urls)
+    tester.progress_position = index
+    
+    setup_event_loop(loop)
+    asyncio.run(tester.run_test())
+    
+    return tester
+
+def run_test_in_processes(tester, processes: int, loop: str = 'auto'):
+    """
+    Spread a test over several processes and merge their results into tester
+    
+    Requests and concurrency are divided evenly between the processes, each
+    running its own event loop, so the load generator is not limited to one core.
+    
+    Args:
+        tester: Configured StressTester instance
+        processes: Number of worker processes
+        loop: Event loop implementation used by each process
+    """
+    config = tester.config
+    
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = []
+        for index in range(processes):
+            partition = dataclasses.replace(
+                config,
+                num_requests=_split_evenly(config.num_requests, processes, index),
+                concurrency=_split_evenly(config.concurrency, processes, index)
+            )
+            futures.append(executor.submit(_run_test_partition, partition, tester.urls, loop, index))
+        partitions = [future.result() for future in futures]
+    
+    # Merge partial results
+    for partition in partitions:
+        tester.merge(partition)
+    
+    tester.start_time = min(p.start_time for p in partitions)
+    tester.end_time = max(p.end_time for p in partitions)
+
+# Wizard questions as (answer key, prompt), in the order they are asked
+_WIZARD_FIELDS = (
+    ('urls', "Target URL (bisa lebih dari satu, pisahkan spasi)"),
+    ('method', "HTTP Method [GET/POST/PUT/DELETE] (default: GET)"),
+    ('num_requests', "Jumlah request (default: 200)"),
+    ('concurrency', "Concurrency (default: 50)"),
+    ('rate_limit', "Rate limit per worker (QPS, kosong=tanpa limit)"),
+    ('duration', "Durasi pengujian (misal 10s, 3m, kosong=pakai jumlah request)"),
+    ('timeout', "Timeout per request (default: 20)"),
+    ('headers', "Tambahkan header (format Key:Value, kosong untuk lanjut)"),
+    ('data', "Body request (kosong jika tidak ada)"),
+    ('data_file', "Body request dari file (kosong jika tidak ada)"),
+    ('content_type', "Content-Type (default: text/html)"),
+    ('auth', "Basic auth (username:password, kosong jika tidak ada)"),
+    ('proxy', "Proxy (host:port, kosong jika tidak ada)"),
+    ('http2', "Aktifkan HTTP/2? (y/n, default: n)"),
+    ('host', "Custom Host header (kosong jika tidak ada)"),
+    ('disable_compression', "Disable compression? (y/n, default: n)"),
+    ('disable_keepalive', "Disable keep-alive? (y/n, default: n)"),
+    ('disable_redirects', "Disable redirects? (y/n, default: n)"),
+    ('cpus', "Jumlah CPU core (default: 1)"),
+    ('assert_status', "Assert status code (kosong jika tidak ada)"),
+    ('assert_body_contains', "Assert body contains (kosong jika tidak ada)"),
+    ('assert_max_rt', "Assert max response time (detik, kosong jika tidak ada)"),
+    ('step_load', "Aktifkan step load/ramp-up concurrency? (y/n, default: n)"),
+    ('step_initial', "Step load: concurrency awal (default: 1)"),
+    ('step_max', "Step load: concurrency maksimum (default: concurrency)"),
+    ('step_interval', "Step load: interval detik (default: 10)"),
+    ('step_increment', "Step load: increment worker (default: 1)"),
+    ('output', "Output (csv/json/jsonl, kosong=ringkasan saja)"),
+)
+
+# Questions only asked when step load is enabled
+_STEP_LOAD_FIELDS = ('step_initial', 'step_max', 'step_interval', 'step_increment')
+
+def _form_available() -> bool:
+    """Check whether the full-screen wizard form can be used"""
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        return False
+    
+    try:
+        import prompt_toolkit  # noqa: F401
+    except ImportError:
+        return False
+    
+    return True
+
+def _ask_form() -> Optional[dict]:
+    """
+    Ask all wizard questions at once in a prompt_toolkit form
+    
+    Returns:
+        Dictionary of raw answers, or None if the form was cancelled
+    """
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+    from prompt_toolkit.key_binding.bindings.focus import focus_next, focus_previous
+    from prompt_toolkit.key_binding.defaults import load_key_bindings
+    from prompt_toolkit.layout import HSplit, Layout, ScrollablePane, VSplit
+    from prompt_toolkit.widgets import Button, Dialog, Label, TextArea
+    
+    inputs = {}
+    rows = []
+    for name, prompt in _WIZARD_FIELDS:
+        if name == 'headers':
+            # One header per line instead of repeated prompts
+            inputs[name] = TextArea(multiline=True, height=3)
+            prompt = "Headers (format Key:Value, satu per baris)"
+        else:
+            inputs[name] = TextArea(multiline=False)
+        rows.append(VSplit([Label(prompt, width=60), inputs[name]], padding=1))
+    
+    def accept():
+        app.exit(result=True)
+    
+    def cancel():
+        app.exit(result=False)
+    
+    dialog = Dialog(
+        title="PyRush Interactive Mode",
+        body=ScrollablePane(HSplit(rows)),
+        buttons=[Button(text="OK", handler=accept), Button(text="Cancel", handler=cancel)],
+        with_background=True
+    )
+    
+    bindings = KeyBindings()
+    bindings.add('tab')(focus_next)
+    bindings.add('s-tab')(focus_previous)
+    
+    app = Application(
+        layout=Layout(dialog),
+        key_bindings=merge_key_bindings([load_key_bindings(), bindings]),
+        mouse_support=True,
+        full_screen=True
+    )
+    
+    if not app.run():
+        return None
+    
+    answers = {name: text_area.text for name, text_area in inputs.items()}
+    answers['headers'] = answers['headers'].splitlines()
+    return answers
+
+def _ask_sequential() -> dict:
+    """
+    Ask the wizard questions one at a time on the terminal
+    
+    Returns:
+        Dictionary of raw answers
+    """
+    answers = {}
+    for name, prompt in _WIZARD_FIELDS:
+        if name in _STEP_LOAD_FIELDS and answers['step_load'].lower() != 'y':
+            answers[name] = ''
+        elif name == 'headers':
+            # Keep asking until an empty line is entered
+            lines = []
+            while True:
+                h = input(f"{prompt}: ")
+                if not h.strip():
+                    break
+                lines.append(h)
+            answers[name] = lines
+        else:
+            answers[name] = input(f"{prompt}: ")
+    
+    return answers
 
 def run_interactive_mode():
     """
     Run interactive mode (wizard CLI) to collect test parameters
     
+    All questions are shown in a single form when prompt_toolkit is installed
+    and the session is interactive, otherwise they are asked one by one.
+    
     Returns:
         Parsed arguments object with user input
     """
     print("=== PyRush Interactive Mode ===")
     
+    if _form_available():
+        answers = _ask_form()
+        if answers is None:
+            print("Test cancelled.")
+            return None
+    else:
+        answers = _ask_sequential()
+    
     # Collect basic parameters
-    urls = input("Target URL (bisa lebih dari satu, pisahkan spasi): ").strip().split()
-    method = input("HTTP Method [GET/POST/PUT/DELETE] (default: GET): ").strip().upper() or 'GET'
-    num_requests = int(input("Jumlah request (default: 200): ") or 200)
-    concurrency = int(input("Concurrency (default: 50): ") or 50)
+    urls = answers['urls'].strip().split()
+    method = answers['method'].strip().upper() or 'GET'
+    num_requests = int(answers['num_requests'] or 200)
+    concurrency = int(answers['concurrency'] or 50)
     
     # Rate limiting
-    rate_limit = input("Rate limit per worker (QPS, kosong=tanpa limit): ")
+    rate_limit = answers['rate_limit']
     rate_limit = float(rate_limit) if rate_limit else None
     
     # Duration
-    duration = input("Durasi pengujian (misal 10s, 3m, kosong=pakai jumlah request): ")
+    duration = answers['duration']
     duration = parse_duration(duration) if duration else None
     
     # Timeout
-    timeout = float(input("Timeout per request (default: 20): ") or 20)
+    timeout = float(answers['timeout'] or 20)
     
     # Headers
-    headers = {}
-    while True:
-        h = input("Tambahkan header (format Key:Value, kosong untuk lanjut): ")
-        if not h.strip():
-            break
-        if ':' in h:
-            k, v = h.split(':', 1)
-            headers[k.strip()] = v.strip()
+    header_items = []
+    for h in answers['headers']:
+        k, sep, v = h.partition(':')
+        if sep:
+            header_items.append((k.strip(), v.strip()))
+    headers = dict(header_items)
     
     # Request body
-    data = input("Body request (kosong jika tidak ada): ")
-    data_file = input("Body request dari file (kosong jika tidak ada): ")
-    content_type = input("Content-Type (default: text/html): ") or 'text/html'
+    data = answers['data']
+    data_file = answers['data_file']
+    content_type = answers['content_type'] or 'text/html'
     
     # Authentication and proxy
-    auth = input("Basic auth (username:password, kosong jika tidak ada): ")
-    proxy = input("Proxy (host:port, kosong jika tidak ada): ")
+    auth = answers['auth']
+    proxy = answers['proxy']
     
     # HTTP settings
-    http2 = input("Aktifkan HTTP/2? (y/n, default: n): ").lower() == 'y'
-    host = input("Custom Host header (kosong jika tidak ada): ")
-    disable_compression = input("Disable compression? (y/n, default: n): ").lower() == 'y'
-    disable_keepalive = input("Disable keep-alive? (y/n, default: n): ").lower() == 'y'
-    disable_redirects = input("Disable redirects? (y/n, default: n): ").lower() == 'y'
-    cpus = int(input("Jumlah CPU core (default: 8): ") or 8)
+    http2 = answers['http2'].lower() == 'y'
+    host = answers['host']
+    disable_compression = answers['disable_compression'].lower() == 'y'
+    disable_keepalive = answers['disable_keepalive'].lower() == 'y'
+    disable_redirects = answers['disable_redirects'].lower() == 'y'
+    cpus = int(answers['cpus'] or 1)
     
     # Assertions
-    assert_status = input("Assert status code (kosong jika tidak ada): ")
+    assert_status = answers['assert_status']
     assert_status = int(assert_status) if assert_status else None
-    assert_body_contains = input("Assert body contains (kosong jika tidak ada): ") or None
-    assert_max_rt = input("Assert max response time (detik, kosong jika tidak ada): ")
+    assert_body_contains = answers['assert_body_contains'] or None
+    assert_max_rt = answers['assert_max_rt']
     assert_max_rt = float(assert_max_rt) if assert_max_rt else None
     
     # Step load
-    step_load = input("Aktifkan step load/ramp-up concurrency? (y/n, default: n): ").lower() == 'y'
-    step_initial = int(input("Step load: concurrency awal (default: 1): ") or 1) if step_load else None
-    step_max = int(input("Step load: concurrency maksimum (default: concurrency): ") or concurrency) if step_load else None
-    step_interval = int(input("Step load: interval detik (default: 10): ") or 10) if step_load else None
-    step_increment = int(input("Step load: increment worker (default: 1): ") or 1) if step_load else None
+    step_load = answers['step_load'].lower() == 'y'
+    step_initial = int(answers['step_initial'] or 1) if step_load else None
+    step_max = int(answers['step_max'] or concurrency) if step_load else None
+    step_interval = int(answers['step_interval'] or 10) if step_load else None
+    step_increment = int(answers['step_increment'] or 1) if step_load else None
     
     # Output
-    output = input("Output (csv/json, kosong=ringkasan saja): ") or None
+    output = answers['output'] or None
     
     # Show configuration summary
-    print("\nConfiguration Summary:")
-    print(f"URLs: {urls}")
-    print(f"Method: {method}")
-    print(f"Requests: {num_requests}")
-    print(f"Concurrency: {concurrency}")
-    print(f"Rate limit: {rate_limit}")
-    print(f"Duration: {duration}")
-    print(f"Timeout: {timeout}")
-    print(f"Headers: {headers}")
-    print(f"Body: {data}")
-    print(f"Body file: {data_file}")
-    print(f"Content-Type: {content_type}")
-    print(f"Auth: {auth}")
-    print(f"Proxy: {proxy}")
-    print(f"HTTP/2: {http2}")
-    print(f"Host: {host}")
-    print(f"Disable compression: {disable_compression}")
-    print(f"Disable keepalive: {disable_keepalive}")
-    print(f"Disable redirects: {disable_redirects}")
-    print(f"CPU: {cpus}")
-    print(f"Assert status: {assert_status}")
-    print(f"Assert body contains: {assert_body_contains}")
-    print(f"Assert max rt: {assert_max_rt}")
-    print(f"Step load: {step_load}")
+    summary = {
+        'URLs': urls,
+        'Method': method,
+        'Requests': num_requests,
+        'Concurrency': concurrency,
+        'Rate limit': rate_limit,
+        'Duration': duration,
+        'Timeout': timeout,
+        'Headers': headers,
+        'Body': data,
+        'Body file': data_file,
+        'Content-Type': content_type,
+        'Auth': auth,
+        'Proxy': proxy,
+        'HTTP/2': http2,
+        'Host': host,
+        'Disable compression': disable_compression,
+        'Disable keepalive': disable_keepalive,
+        'Disable redirects': disable_redirects,
+        'CPU': cpus,
+        'Assert status': assert_status,
+        'Assert body contains': assert_body_contains,
+        'Assert max rt': assert_max_rt,
+        'Step load': step_load,
+    }
     if step_load:
-        print(f"  Step initial: {step_initial}")
-        print(f"  Step max: {step_max}")
-        print(f"  Step interval: {step_interval}")
-        print(f"  Step increment: {step_increment}")
-    print(f"Output: {output}")
+        summary.update({
+            '  Step initial': step_initial,
+            '  Step max': step_max,
+            '  Step interval': step_interval,
+            '  Step increment': step_increment,
+        })
+    summary['Output'] = output
+    
+    sys.stdout.write("\nConfiguration Summary:\n" + "\n".join(f"{k}: {v}" for k, v in summary.items()) + "\n")
     
     # Confirm execution
     confirm = input("Continue with test? (y/n): ").lower()
@@ -117,56 +318,81 @@ def run_interactive_mode():
         print("Test cancelled.")
         return None
     
-    # Create mock args object
-    class MockArgs:
-        pass
-    
-    args = MockArgs()
-    args.urls = urls
-    args.method = method
-    args.num_requests = num_requests
-    args.concurrency = concurrency
-    args.rate_limit = rate_limit
-    args.duration = duration
-    args.timeout = timeout
-    args.header = [f"{k}: {v}" for k, v in headers.items()]
-    args.data = data if data else None
-    args.data_file = data_file if data_file else None
-    args.content_type = content_type
-    args.auth = auth if auth else None
-    args.proxy = proxy if proxy else None
-    args.http2 = http2
-    args.host = host if host else None
-    args.disable_compression = disable_compression
-    args.disable_keepalive = disable_keepalive
-    args.disable_redirects = disable_redirects
-    args.cpus = cpus
-    args.assert_status = assert_status
-    args.assert_body_contains = assert_body_contains
-    args.assert_max_rt = assert_max_rt
-    args.step_load = step_load
-    args.step_initial = step_initial if step_load else 1
-    args.step_max = step_max if step_load else concurrency
-    args.step_interval = step_interval if step_load else 10
-    args.step_increment = step_increment if step_load else 1
-    args.output = output
-    args.form = []
-    args.form_file = []
+    # Build the same namespace argparse would produce
+    args = argparse.Namespace(
+        urls=urls,
+        method=method,
+        num_requests=num_requests,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        duration=duration,
+        timeout=timeout,
+        header=[f"{k}: {v}" for k, v in headers.items()],
+        accept=None,
+        data=data if data else None,
+        data_file=data_file if data_file else None,
+        content_type=content_type,
+        auth=auth if auth else None,
+        proxy=proxy if proxy else None,
+        http2=http2,
+        host=host if host else None,
+        disable_compression=disable_compression,
+        disable_keepalive=disable_keepalive,
+        disable_redirects=disable_redirects,
+        cpus=cpus,
+        loop='auto',
+        assert_status=assert_status,
+        assert_body_contains=assert_body_contains,
+        assert_max_rt=assert_max_rt,
+        step_load=step_load,
+        step_initial=step_initial if step_load else 1,
+        step_max=step_max if step_load else concurrency,
+        step_interval=step_interval if step_load else 10,
+        step_increment=step_increment if step_load else 1,
+        output=output,
+        json_backend='stdlib',
+        max_stored_results=None,
+        form=[],
+        form_file=[],
+    )
     
     return args
 
-def main():
+def main(args: Optional[argparse.Namespace] = None):
     """
     Main entry point for PyRush CLI
     
     Handles argument parsing, test execution, and result reporting.
+    
+    Args:
+        args: Pre-parsed arguments for programmatic use; parsed from the
+            command line when omitted
+        
+    Returns:
+        Process exit code (0 on success)
     """
-    # Create and parse arguments
-    parser = create_argument_parser()
-    args = parser.parse_args()
+    global _REPORT_DIR_READY
+    
+    if args is None:
+        # Create and parse arguments
+        parser = create_argument_parser()
+        args = parser.parse_args()
+        
+        # Load options from config file; explicit command line options override it
+        if args.config:
+            try:
+                options = load_config_file(args.config)
+            except (OSError, ValueError) as e:
+                parser.error(f"Cannot load config file: {e}")
+            args = parser.parse_args(namespace=argparse.Namespace(**options))
+            if not args.urls:
+                args.urls = options.get('urls', [])
+        
+        if not args.urls and not args.interactive:
+            parser.error("the following arguments are required: urls")
     
     # Handle interactive mode
-    if args.interactive:
+    if getattr(args, 'interactive', False):
         args = run_interactive_mode()
         if args is None:
             return 0
@@ -176,25 +402,9 @@ def main():
         config = create_test_config_from_args(args)
         urls = args.urls
         
-        # Create and configure stress tester
+        # Create stress tester
         tester = StressTester(config, urls)
         
-        # Set assertion parameters
-        tester.assert_status = args.assert_status
-        tester.assert_body_contains = args.assert_body_contains
-        tester.assert_max_rt = args.assert_max_rt
-        
-        # Set step load parameters
-        tester.step_load = args.step_load
-        tester.step_initial = args.step_initial
-        tester.step_max = args.step_max if args.step_max else config.concurrency
-        tester.step_interval = args.step_interval
-        tester.step_increment = args.step_increment
-        
-        # Set form data parameters
-        tester.form = args.form
-        tester.form_file = args.form_file
-        
         # Display test configuration
         print(f"Starting stress test...")
         print(f"URLs: {', '.join(urls)}")
@@ -205,10 +415,23 @@ def main():
             print(f"Rate limit: {config.rate_limit} QPS per worker")
         if config.duration:
             print(f"Duration: {config.duration}s")
+        if (config.form or config.form_file) and any(k.lower() == 'content-type' for k in config.headers):
+            print("[WARNING] Custom Content-Type header replaces the multipart/form-data boundary; the server may not parse the form")
+        if any(k.lower() == 'connection' and v.strip().lower() == 'close' for k, v in config.headers.items()):
+            print("[WARNING] 'Connection: close' header opens a new connection (and TLS handshake) for every request; use --disable-keepalive if that is intended")
+        
+        # Step load ramps a single pool of workers, so it always runs in-process
+        processes = min(config.cpus, os.cpu_count() or 1, config.concurrency)
+        if processes > 1 and not config.step_load:
+            print(f"Processes: {processes}")
         print()
         
         # Run the test
-        asyncio.run(tester.run_test())
+        if processes > 1 and not config.step_load:
+            run_test_in_processes(tester, processes, args.loop)
+        else:
+            setup_event_loop(args.loop)
+            asyncio.run(tester.run_test())
         
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -222,59 +445,84 @@ def main():
         stats = tester.generate_statistics()
         print("[INFO] Statistics generated successfully")
         
-        print("\n" + "="*60)
-        print("PYRUSH STRESS TEST RESULTS")
-        print("="*60)
-        print(f"Total Requests: {stats['total_requests']}")
-        print(f"Successful Requests: {stats['successful_requests']}")
-        print(f"Failed Requests: {stats['failed_requests']}")
-        print(f"Success Rate: {stats['success_rate']:.2f}%")
-        print(f"Total Duration: {stats['total_duration']:.2f}s")
-        print(f"Requests per Second: {stats['requests_per_second']:.2f}")
-        print(f"Throughput (bytes/sec): {stats['throughput_bytes_per_sec']:.2f}")
+        # Build the results summary and write it out in one go
+        lines = [
+            "",
+            "=" * 60,
+            "PYRUSH STRESS TEST RESULTS",
+            "=" * 60,
+            f"Total Requests: {stats['total_requests']}",
+            f"Successful Requests: {stats['successful_requests']}",
+            f"Failed Requests: {stats['failed_requests']}",
+            f"Success Rate: {stats['success_rate']:.2f}%",
+            f"Total Duration: {stats['total_duration']:.2f}s",
+            f"Requests per Second: {stats['requests_per_second']:.2f}",
+            f"Throughput (bytes/sec): {stats['throughput_bytes_per_sec']:.2f}",
+        ]
         
-        # Display response time statistics
+        # Response time statistics
         if 'mean_response_time' in stats:
-            print(f"\nResponse Time Statistics:")
-            print(f"  Mean: {stats['mean_response_time']:.3f}s")
-            print(f"  Median: {stats['median_response_time']:.3f}s")
-            print(f"  Min: {stats['min_response_time']:.3f}s")
-            print(f"  Max: {stats['max_response_time']:.3f}s")
-            print(f"  P25: {stats['p25_response_time']:.3f}s")
-            print(f"  P50: {stats['p50_response_time']:.3f}s")
-            print(f"  P75: {stats['p75_response_time']:.3f}s")
-            print(f"  P90: {stats['p90_response_time']:.3f}s")
-            print(f"  P95: {stats['p95_response_time']:.3f}s")
-            print(f"  P99: {stats['p99_response_time']:.3f}s")
+            lines.extend([
+                "",
+                "Response Time Statistics:",
+                f"  Mean: {stats['mean_response_time']:.3f}s",
+                f"  Median: {stats['median_response_time']:.3f}s",
+                f"  Min: {stats['min_response_time']:.3f}s",
+                f"  Max: {stats['max_response_time']:.3f}s",
+                f"  P25: {stats['p25_response_time']:.3f}s",
+                f"  P50: {stats['p50_response_time']:.3f}s",
+                f"  P75: {stats['p75_response_time']:.3f}s",
+                f"  P90: {stats['p90_response_time']:.3f}s",
+                f"  P95: {stats['p95_response_time']:.3f}s",
+                f"  P99: {stats['p99_response_time']:.3f}s",
+            ])
         
-        # Display status code distribution
+        # Status code distribution
         if stats.get('status_code_distribution'):
-            print(f"\nStatus Code Distribution:")
-            for status_code, count in sorted(stats['status_code_distribution'].items()):
-                print(f"  {status_code}: {count}")
+            lines.extend(["", "Status Code Distribution:"])
+            lines.extend(f"  {status_code}: {count}"
+                         for status_code, count in sorted(stats['status_code_distribution'].items()))
         
-        # Display error distribution
+        # Error distribution
         if stats.get('error_distribution'):
-            print(f"\nError Distribution:")
-            for error_type, count in stats['error_distribution'].items():
-                print(f"  {error_type}: {count}")
+            lines.extend(["", "Error Distribution:"])
+            lines.extend(f"  {error_type}: {count}"
+                         for error_type, count in stats['error_distribution'].items())
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         # Create output directory
-        os.makedirs('report_files', exist_ok=True)
+        if not _REPORT_DIR_READY:
+            os.makedirs(_REPORT_DIR, exist_ok=True)
+            _REPORT_DIR_READY = True
+        
+        # Share one timestamp so all files from this run can be matched up
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         
-        # Export results based on output type
+        # Export results based on output type; the reporter (matplotlib,
+        # reportlab) is imported lazily so --help and aborted runs skip it
         if args.output == 'csv':
-            csv_filename = os.path.join('report_files', f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+            from .reporter import export_csv
+            csv_filename = os.path.join(_REPORT_DIR, f"results_{timestamp}.csv")
             export_csv(tester, csv_filename)
             print(f"[INFO] CSV results exported to: {csv_filename}")
         
         if args.output == 'json':
-            json_filename = os.path.join('report_files', f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            export_json(tester, json_filename, stats)
+            from .reporter import export_json
+            json_filename = os.path.join(_REPORT_DIR, f"results_{timestamp}.json")
+            export_json(tester, json_filename, stats, backend=args.json_backend)
             print(f"[INFO] JSON results exported to: {json_filename}")
         
+        if args.output == 'jsonl':
+            from .reporter import export_jsonl
+            jsonl_filename = os.path.join(_REPORT_DIR, f"results_{timestamp}.jsonl")
+            export_jsonl(tester, jsonl_filename, stats, backend=args.json_backend)
+            print(f"[INFO] JSON Lines results exported to: {jsonl_filename}")
+        
         # Always generate PDF report
-        pdf_filename = os.path.join('report_files', f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
+        from .reporter import generate_pdf_report
+        pdf_filename = os.path.join(_REPORT_DIR, f"report_{timestamp}.pdf")
         generate_pdf_report(tester, pdf_filename)
         print(f"[INFO] PDF report generated: {pdf_filename}")
         
@@ -287,4 +535,8 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    exit(main()) 
\ No newline at end of file
+    # Skip interpreter teardown (GC of potentially millions of results)
+    rc = main()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(rc) 
\ No newline at end of file
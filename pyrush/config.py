@@ -3,8 +3,15 @@ Configuration and argument parsing for PyRush
 """
 
 import argparse
+import functools
+import json
+import re
 from .models import TestConfig
 
+# Duration strings such as '10s', '1.5m' or '2h'
+_DURATION_RE = re.compile(r'^\s*([0-9]*\.?[0-9]+)\s*([smhSMH])\s*$')
+_DURATION_MULTIPLIERS = {'s': 1.0, 'm': 60.0, 'h': 3600.0}
+
 def parse_duration(duration_str: str) -> float:
     """
     Parse duration string into seconds
@@ -21,22 +28,19 @@ def parse_duration(duration_str: str) -> float:
     if not duration_str:
         return None
     
-    unit = duration_str[-1].lower()
-    value = float(duration_str[:-1])
-    
-    if unit == 's':
-        return value
-    elif unit == 'm':
-        return value * 60
-    elif unit == 'h':
-        return value * 3600
-    else:
+    match = _DURATION_RE.match(duration_str)
+    if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
+    
+    return float(match.group(1)) * _DURATION_MULTIPLIERS[match.group(2).lower()]
 
+@functools.lru_cache(maxsize=1)
 def create_argument_parser() -> argparse.ArgumentParser:
     """
     Create and configure argument parser for PyRush CLI
     
+    The parser is built once and cached, so callers must not modify it.
+    
     Returns:
         Configured ArgumentParser instance
     """
@@ -53,7 +57,7 @@ Contoh:
     )
     
     # Basic arguments
-    parser.add_argument('urls', nargs='+', help='Target URL(s) to test (bisa lebih dari satu)')
+    parser.add_argument('urls', nargs='*', help='Target URL(s) to test (bisa lebih dari satu)')
     parser.add_argument('-n', '--num-requests', type=int, default=200,
                        help='Number of requests to run (default: 200)')
     parser.add_argument('-c', '--concurrency', type=int, default=50,
@@ -62,12 +66,16 @@ Contoh:
                        help='Rate limit in queries per second (QPS) per worker')
     parser.add_argument('-z', '--duration', type=parse_duration,
                        help='Duration of test (e.g., 10s, 3m, 1h). If specified, -n is ignored')
-    parser.add_argument('-o', '--output', choices=['csv', 'json'],
-                       help='Output type. "csv" atau "json" untuk ekspor hasil, default: ringkasan di terminal')
+    parser.add_argument('-o', '--output', choices=('csv', 'json', 'jsonl'),
+                       help='Output type. "csv", "json" atau "jsonl" (JSON Lines) untuk ekspor hasil, default: ringkasan di terminal')
+    parser.add_argument('--json-backend', choices=('stdlib', 'orjson'), default='stdlib',
+                       help='JSON encoder used for -o json/jsonl (default: stdlib)')
+    parser.add_argument('--max-stored-results', type=int,
+                       help='Simpan maksimal N hasil pertama untuk ekspor dan tabel PDF; statistik tetap mencakup semua request (default: semua)')
     
     # HTTP method and headers
     parser.add_argument('-m', '--method', default='GET',
-                       choices=['GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'],
+                       choices=('GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'),
                        help='HTTP method (default: GET)')
     parser.add_argument('-H', '--header', action='append', default=[],
                        help='Custom HTTP header (can be repeated)')
@@ -93,8 +101,10 @@ Contoh:
                        help='Disable keep-alive')
     parser.add_argument('--disable-redirects', action='store_true',
                        help='Disable following HTTP redirects')
-    parser.add_argument('--cpus', type=int, default=8,
-                       help='Number of CPU cores to use (default: 8)')
+    parser.add_argument('--cpus', type=int, default=1,
+                       help='Number of CPU cores (worker processes) to use (default: 1)')
+    parser.add_argument('--loop', choices=('auto', 'asyncio', 'uvloop'), default='auto',
+                       help='Event loop implementation (default: auto, uses uvloop when installed)')
     
     # Assertion options
     parser.add_argument('--assert-status', type=int, help='Assert status code harus sama dengan nilai ini')
@@ -103,6 +113,8 @@ Contoh:
     
     # Interactive mode
     parser.add_argument('-i', '--interactive', action='store_true', help='Jalankan mode interaktif (wizard CLI)')
+    parser.add_argument('--config', type=str,
+                       help='Load options from a JSON/YAML file (command line options take precedence)')
     
     # Form data options
     parser.add_argument('--form', action='append', default=[], help='Field form-data, format FIELD=VALUE (bisa diulang)')
@@ -117,6 +129,53 @@ Contoh:
     
     return parser
 
+def load_config_file(path: str) -> dict:
+    """
+    Load command line options from a JSON or YAML file
+    
+    Keys are the long option names, either with dashes or underscores
+    (e.g. 'num-requests' or 'num_requests'). 'urls' may be a single string,
+    'duration' a duration string and 'header' a mapping of header names to values.
+    
+    Args:
+        path: Path to the config file (.json, .yaml or .yml)
+        
+    Returns:
+        Dictionary of option values keyed by argument name
+        
+    Raises:
+        ValueError: If the file is malformed or contains unknown options
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("PyYAML is required for YAML config files (pip install pyyaml)")
+            options = yaml.safe_load(f) or {}
+        else:
+            options = json.load(f)
+    
+    if not isinstance(options, dict):
+        raise ValueError(f"Config file {path} must contain a mapping of options")
+    
+    options = {key.replace('-', '_'): value for key, value in options.items()}
+    
+    known = set(vars(create_argument_parser().parse_args([])))
+    unknown = sorted(set(options) - known - {'interactive', 'config'})
+    if unknown:
+        raise ValueError(f"Unknown option(s) in {path}: {', '.join(unknown)}")
+    
+    # Normalize values that argparse would otherwise convert
+    if isinstance(options.get('urls'), str):
+        options['urls'] = [options['urls']]
+    if isinstance(options.get('duration'), str):
+        options['duration'] = parse_duration(options['duration'])
+    if isinstance(options.get('header'), dict):
+        options['header'] = [f"{k}: {v}" for k, v in options['header'].items()]
+    
+    return options
+
 def parse_headers_from_args(args) -> dict:
     """
     Parse headers from command line arguments
@@ -127,13 +186,13 @@ def parse_headers_from_args(args) -> dict:
     Returns:
         Dictionary of headers
     """
-    headers = {}
-    
-    # Parse custom headers
+    # Parse custom headers into pairs and build the dict in one go
+    items = []
     for header in args.header:
-        if ':' in header:
-            key, value = header.split(':', 1)
-            headers[key.strip()] = value.strip()
+        key, sep, value = header.partition(':')
+        if sep:
+            items.append((key.strip(), value.strip()))
+    headers = dict(items)
     
     # Add Accept header if specified
     if args.accept:
@@ -176,27 +235,61 @@ def create_test_config_from_args(args) -> TestConfig:
     Raises:
         ValueError: If configuration is invalid
     """
+    num_requests = args.num_requests
+    concurrency = args.concurrency
+    data = args.data
+    data_file = args.data_file
+    
     headers = parse_headers_from_args(args)
     auth = parse_auth_from_args(args)
     
-    # Validate configuration
-    if args.num_requests < args.concurrency:
-        raise ValueError(f"Number of requests ({args.num_requests}) cannot be smaller than concurrency ({args.concurrency})")
+    # Validate configuration before anything is allocated for the test
+    if not args.urls:
+        raise ValueError("At least one URL is required")
     
-    if args.data and args.data_file:
+    if concurrency <= 0:
+        raise ValueError(f"Concurrency must be greater than 0 (got {concurrency})")
+    
+    if num_requests < concurrency:
+        raise ValueError(f"Number of requests ({num_requests}) cannot be smaller than concurrency ({concurrency})")
+    
+    if args.timeout <= 0:
+        raise ValueError(f"Timeout must be greater than 0 (got {args.timeout})")
+    
+    if args.rate_limit is not None and args.rate_limit < 0:
+        raise ValueError(f"Rate limit cannot be negative (got {args.rate_limit})")
+    
+    if args.assert_max_rt is not None and args.assert_max_rt <= 0:
+        raise ValueError(f"Assert max response time must be greater than 0 (got {args.assert_max_rt})")
+    
+    if args.max_stored_results is not None and args.max_stored_results < 0:
+        raise ValueError(f"Max stored results cannot be negative (got {args.max_stored_results})")
+    
+    if data and data_file:
         raise ValueError("Cannot specify both -d and -D options")
     
+    step_max = args.step_max if args.step_max else concurrency
+    if args.step_load:
+        if args.step_initial < 1:
+            raise ValueError(f"Step load initial concurrency must be at least 1 (got {args.step_initial})")
+        if step_max < args.step_initial:
+            raise ValueError(f"Step load maximum concurrency ({step_max}) cannot be smaller than initial concurrency ({args.step_initial})")
+        if args.step_interval <= 0:
+            raise ValueError(f"Step load interval must be greater than 0 (got {args.step_interval})")
+        if args.step_increment < 1:
+            raise ValueError(f"Step load increment must be at least 1 (got {args.step_increment})")
+    
     return TestConfig(
         url=args.urls[0],
         method=args.method,
-        num_requests=args.num_requests,
-        concurrency=args.concurrency,
+        num_requests=num_requests,
+        concurrency=concurrency,
         rate_limit=args.rate_limit,
         duration=args.duration,
         timeout=args.timeout,
         headers=headers,
-        data=args.data,
-        data_file=args.data_file,
+        data=data,
+        data_file=data_file,
         content_type=args.content_type,
         auth=auth,
         proxy=args.proxy,
@@ -205,5 +298,16 @@ def create_test_config_from_args(args) -> TestConfig:
         disable_compression=args.disable_compression,
         disable_keepalive=args.disable_keepalive,
         disable_redirects=args.disable_redirects,
-        cpus=args.cpus
+        cpus=args.cpus,
+        assert_status=args.assert_status,
+        assert_body_contains=args.assert_body_contains,
+        assert_max_rt=args.assert_max_rt,
+        step_load=args.step_load,
+        step_initial=args.step_initial,
+        step_max=step_max,
+        step_interval=args.step_interval,
+        step_increment=args.step_increment,
+        form=args.form,
+        form_file=args.form_file,
+        max_stored_results=args.max_stored_results
     ) 
\ No newline at end of file
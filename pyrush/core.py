@@ -6,13 +6,62 @@ import asyncio
 import aiohttp
 import ssl
 import certifi
-import statistics
+import functools
+import heapq
+import itertools
+import numpy as np
 import threading
 import time
-from typing import Dict, List
+from array import array
+from typing import Dict, List, Optional
 from tqdm import tqdm
 from .models import TestConfig, RequestResult
-from .requestor import worker
+from .requestor import RateLimiter, prepare_request, worker
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Build the client SSL context once per process
+    
+    Loading the certifi CA bundle is comparatively expensive, so the context is
+    shared by every connector and run_test call instead of being rebuilt each
+    time. ALPN advertises HTTP/1.1, the only protocol aiohttp speaks, so
+    servers don't have to fall back from HTTP/2 negotiation.
+    
+    Returns:
+        SSL context verifying against the certifi CA bundle
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.set_alpn_protocols(['http/1.1'])
+    return context
+
+def setup_event_loop(loop: str = 'auto'):
+    """
+    Install the event loop policy used to drive the test
+    
+    uvloop (libuv-based, C socket and timer handling) is used when available
+    since the tester is dominated by event loop overhead on small requests.
+    This is done explicitly rather than at import time so that importing
+    PyRush as a library does not change the caller's event loop policy.
+    
+    Args:
+        loop: 'auto' (uvloop if installed), 'asyncio' (default selector loop) or 'uvloop'
+        
+    Raises:
+        ValueError: If uvloop is requested but not installed
+    """
+    if loop == 'asyncio':
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and not available on Windows
+        if loop == 'uvloop':
+            raise ValueError("uvloop is not installed (pip install uvloop)")
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 class StressTester:
     """
@@ -21,6 +70,13 @@ class StressTester:
     Handles the execution of stress tests, manages workers, and collects results.
     """
     
+    # Number of slowest successful requests tracked for the report
+    SLOWEST_KEPT = 10
+    
+    # Response times are stored as unsigned 32-bit microseconds, which covers
+    # up to ~71 minutes; longer times are clamped
+    RT_MAX_US = 0xFFFFFFFF
+    
     def __init__(self, config: TestConfig, urls: list):
         """
         Initialize the stress tester
@@ -37,69 +93,248 @@ class StressTester:
         self.lock = threading.Lock()
         
         # Statistics tracking
-        self.dns_times = []
-        self.connect_times = []
-        self.response_sizes = []
+        self.dns_times = array('d')
+        self.connect_times = array('d')
         
         # Progress tracking
         self.progress_bar = None
         self.progress_total = 0
+        self.progress_position = 0
+        self._progress_pending = 0
+        self._progress_batch = 1
         
-        # Assertion settings
-        self.assert_status = None
-        self.assert_body_contains = None
-        self.assert_max_rt = None
-        
-        # Step load settings
-        self.step_load = False
-        self.step_initial = 1
-        self.step_max = config.concurrency
-        self.step_interval = 10
-        self.step_increment = 1
-        
-        # Form data settings
-        self.form = []
-        self.form_file = []
+        # Columnar (structure-of-arrays) copies of the numeric result fields,
+        # reduced with NumPy when generating statistics. The columns may be
+        # presized by reserve(); only the first self._count rows are results
+        self._count = 0
+        self._rt = array('I')  # Response times in integer microseconds
+        self._status = array('i')
+        self._size = array('q')
+        self._err_idx = array('i')  # Index into self._errors, -1 when successful
+        self._errors: List[str] = []
+        self._error_ids: Dict[str, int] = {}
+        
+        # Min-heap of (response_time, sequence, result) for the slowest
+        # successful requests, kept independently of max_stored_results
+        self._slowest: List[tuple] = []
+    
+    def __getstate__(self):
+        # The lock and progress bar can't be pickled; everything else is sent
+        # back from worker processes in multi-process runs
+        self._trim_columns()
+        state = self.__dict__.copy()
+        state['lock'] = None
+        state['progress_bar'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+    
+    def reserve(self, count: int):
+        """
+        Presize the result columns for count results
+        
+        Avoids repeatedly growing (and copying) the columns when the number
+        of requests is known up front.
+        
+        Args:
+            count: Number of results expected in total
+        """
+        extra = count - len(self._rt)
+        if extra > 0:
+            for column in (self._rt, self._status, self._size, self._err_idx):
+                column.frombytes(bytes(extra * column.itemsize))
+    
+    def _trim_columns(self):
+        """Drop presized column rows that were never filled"""
+        for column in (self._rt, self._status, self._size, self._err_idx):
+            del column[self._count:]
+    
+    def _columns(self) -> tuple:
+        """Return NumPy views of the filled rows of (rt_us, status, size, err_idx)"""
+        n = self._count
+        return (np.frombuffer(self._rt, dtype=np.uintc)[:n],
+                np.frombuffer(self._status, dtype=np.intc)[:n],
+                np.frombuffer(self._size, dtype=np.int64)[:n],
+                np.frombuffer(self._err_idx, dtype=np.intc)[:n])
+    
+    def _intern_error(self, error: str) -> int:
+        """Return the index of error in self._errors, adding it if needed"""
+        error_id = self._error_ids.get(error)
+        if error_id is None:
+            error_id = self._error_ids[error] = len(self._errors)
+            self._errors.append(error)
+        return error_id
+    
+    def _track_slowest(self, result: RequestResult, sequence: int):
+        """Keep result if it is among the SLOWEST_KEPT slowest so far"""
+        entry = (result.response_time, sequence, result)
+        if len(self._slowest) < self.SLOWEST_KEPT:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+    
+    def record_result(self, result: RequestResult):
+        """
+        Store a request result
+        
+        The result is always added to the statistics columns, but only kept
+        in self.results while fewer than config.max_stored_results are stored.
+        
+        Args:
+            result: Completed request result
+        """
+        err_idx = -1 if result.error is None else self._intern_error(result.error)
+        
+        max_stored = self.config.max_stored_results
+        if max_stored is None or len(self.results) < max_stored:
+            # Stored failures share the interned error text instead of each
+            # keeping its own copy of the exception message
+            if err_idx >= 0:
+                result = result._replace(error=self._errors[err_idx])
+            self.results.append(result)
+        
+        i = self._count
+        self._count = i + 1
+        rt_us = min(round(result.response_time * 1e6), self.RT_MAX_US)
+        if i < len(self._rt):
+            self._rt[i] = rt_us
+            self._status[i] = result.status_code
+            self._size[i] = result.response_size
+            self._err_idx[i] = err_idx
+        else:
+            self._rt.append(rt_us)
+            self._status.append(result.status_code)
+            self._size.append(result.response_size)
+            self._err_idx.append(err_idx)
+        
+        if result.error is None:
+            self._track_slowest(result, self._count)
+    
+    def record_results(self, results: List[RequestResult]):
+        """
+        Store a batch of request results and advance the progress bar
+        
+        Args:
+            results: Completed request results
+        """
+        for result in results:
+            self.record_result(result)
+        self.update_progress(len(results))
+    
+    def merge(self, other: 'StressTester'):
+        """
+        Merge the results of another tester (e.g. from a worker process)
+        
+        Args:
+            other: StressTester whose results are added to this one
+        """
+        max_stored = self.config.max_stored_results
+        room = len(other.results) if max_stored is None else max(0, max_stored - len(self.results))
+        self.results.extend(other.results[:room])
+        
+        # Map the other tester's error indices onto ours; -1 (no error) picks
+        # the trailing -1 entry
+        self._trim_columns()
+        offset = self._count
+        other_rt, other_status, other_size, other_err = other._columns()
+        mapping = np.array([self._intern_error(e) for e in other._errors] + [-1], dtype=np.intc)
+        self._err_idx.frombytes(mapping[other_err].tobytes())
+        
+        self._rt.frombytes(other_rt.tobytes())
+        self._status.frombytes(other_status.tobytes())
+        self._size.frombytes(other_size.tobytes())
+        self._count += other._count
+        
+        for _, sequence, result in other._slowest:
+            self._track_slowest(result, offset + sequence)
+        
+        self.dns_times.extend(other.dns_times)
+        self.connect_times.extend(other.connect_times)
+    
+    def slowest_requests(self) -> List[RequestResult]:
+        """
+        Get the slowest successful requests, slowest first
+        
+        Returns:
+            Up to SLOWEST_KEPT results ordered by descending response time
+        """
+        return [entry[2] for entry in sorted(self._slowest, reverse=True)]
+    
+    def successful_response_times(self) -> np.ndarray:
+        """
+        Get the response times of successful requests
+        
+        Returns:
+            NumPy array of response times in seconds
+        """
+        rt_us, _, _, err_idx = self._columns()
+        return rt_us[err_idx < 0] / 1e6
     
     def set_progress_bar(self, pbar, total):
         """Set the progress bar for tracking test progress"""
         self.progress_bar = pbar
         self.progress_total = total
+        # Redraw roughly every 1% of the run, at most every 100 requests
+        self._progress_batch = max(1, min(100, total // 100))
     
-    def update_progress(self):
-        """Update the progress bar"""
+    def update_progress(self, count: int = 1):
+        """
+        Update the progress bar
+        
+        Updates are batched so the bar isn't redrawn after every request;
+        call flush_progress() to push any remainder.
+        
+        Args:
+            count: Number of completed requests to add
+        """
         if self.progress_bar:
-            self.progress_bar.update(1)
+            self._progress_pending += count
+            if self._progress_pending >= self._progress_batch:
+                self.flush_progress()
+    
+    def flush_progress(self):
+        """Push pending progress updates to the progress bar"""
+        if self.progress_bar and self._progress_pending:
+            self.progress_bar.update(self._progress_pending)
+            self._progress_pending = 0
     
     async def run_test(self):
         """
         Run the stress test
         
         This method orchestrates the entire stress testing process:
-        1. Sets up HTTP session with tracing
-        2. Creates request queue
+        1. Sets up HTTP session with per-request DNS/connect tracing
+        2. Creates the shared request ID iterator
         3. Starts workers (with step load if enabled)
         4. Waits for completion
-        5. Collects final statistics
         """
         self.start_time = time.time()
         
-        # Setup tracing for DNS and connection times
-        trace_dns = {}
-        trace_connect = {}
+        # Request options that don't change between requests are built once
+        prepared = prepare_request(self.config)
+        
+        # Step load starts its full pool of workers up front (see below)
+        pool_size = self.config.concurrency
+        if self.config.step_load:
+            pool_size = self.config.step_max or self.config.concurrency
+        
+        # Setup tracing for DNS and connection times. aiohttp creates a fresh
+        # trace context per request, so every lookup and connection is timed
         trace_config = aiohttp.TraceConfig()
         
         async def on_dns_resolvehost_start(session, context, params):
-            trace_dns['start'] = time.time()
+            context.dns_start = time.perf_counter()
         
         async def on_dns_resolvehost_end(session, context, params):
-            trace_dns['end'] = time.time()
+            self.dns_times.append(time.perf_counter() - context.dns_start)
         
         async def on_connection_create_start(session, context, params):
-            trace_connect['start'] = time.time()
+            context.connect_start = time.perf_counter()
         
         async def on_connection_create_end(session, context, params):
-            trace_connect['end'] = time.time()
+            self.connect_times.append(time.perf_counter() - context.connect_start)
         
         # Register trace handlers
         trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
@@ -107,121 +342,181 @@ class StressTester:
         trace_config.on_connection_create_start.append(on_connection_create_start)
         trace_config.on_connection_create_end.append(on_connection_create_end)
         
-        # Setup HTTP connector
-        connector = aiohttp.TCPConnector(
-            limit=self.config.concurrency * 2,
-            limit_per_host=self.config.concurrency,
-            keepalive_timeout=30 if not self.config.disable_keepalive else 0,
-            enable_cleanup_closed=True,
-            ssl=ssl.create_default_context(cafile=certifi.where())
-        )
+        # Allow one connection per worker to each host, leave headroom above
+        # that so multi-host runs don't queue on the global pool, and keep idle
+        # sockets around long enough that they aren't dropped (and
+        # re-handshaked) mid-test. The single session below shares this pool
+        # across every worker and request.
+        connector_kwargs = {
+            'limit': max(200, pool_size * 4),
+            'limit_per_host': pool_size,
+            'enable_cleanup_closed': True,
+            'use_dns_cache': True,
+            'ttl_dns_cache': 300,
+            'ssl': _ssl_context()
+        }
+        
+        if self.config.disable_keepalive:
+            # keepalive_timeout=0 still reuses connections released within the
+            # same loop iteration; force_close sends "Connection: close" and
+            # really opens a new connection for every request
+            connector_kwargs['force_close'] = True
+        else:
+            connector_kwargs['keepalive_timeout'] = 75
+        
+        connector = aiohttp.TCPConnector(**connector_kwargs)
         
-        # Setup session
+        # Setup session; cookies are never looked at, so the dummy jar skips
+        # parsing and storing Set-Cookie headers on every response
         session_kwargs = {
             'connector': connector,
             'trust_env': True,
-            'trace_configs': [trace_config]
+            'trace_configs': [trace_config],
+            'cookie_jar': aiohttp.DummyCookieJar(),
+            'auto_decompress': not self.config.disable_compression,
+            'read_bufsize': 1 << 16
         }
         
         if self.config.http2:
             session_kwargs['version'] = aiohttp.HttpVersion20
         
         async with aiohttp.ClientSession(**session_kwargs) as session:
-            # Create request queue
-            request_queue = asyncio.Queue()
-            
-            # Determine number of requests
-            if self.config.duration:
-                num_requests = 1000000  # Large number for duration-based tests
-            else:
-                num_requests = self.config.num_requests
-            
-            # Add request IDs to queue
-            for i in range(num_requests):
-                await request_queue.put(i)
-            
-            # Add stop signals for workers
-            for _ in range(self.config.concurrency):
-                await request_queue.put(None)
+            # Workers claim request IDs from a shared iterator; asyncio is
+            # single-threaded so next() needs no locking. A fixed-count test
+            # simply runs out of IDs, a duration test counts until stopped.
+            max_requests = None if self.config.duration else self.config.num_requests
+            request_ids = itertools.count() if max_requests is None else iter(range(max_requests))
+            if max_requests is not None:
+                self.reserve(max_requests)
+            stop_event = asyncio.Event()
             
             # Setup progress bar
             pbar = None
             if not self.config.duration:
-                pbar = tqdm(total=num_requests, desc="Progress", unit="req")
-                self.set_progress_bar(pbar, num_requests)
+                pbar = tqdm(total=max_requests, desc="Progress", unit="req",
+                            position=self.progress_position)
+                self.set_progress_bar(pbar, max_requests)
             
-            workers = []
-            
-            # Handle step load (ramp-up concurrency)
-            if self.step_load:
-                initial = self.step_initial
-                max_c = self.step_max
-                interval = self.step_interval
-                increment = self.step_increment
-                current_c = initial
+            def start_tasks(spawn):
+                # Stop claiming new requests once the duration is reached
+                if self.config.duration:
+                    spawn(self._deadline(stop_event))
                 
-                # Start initial workers
-                for _ in range(initial):
-                    w = asyncio.create_task(
-                        worker(self, session, self.urls, self.config.method, 
-                              request_queue, self.config.rate_limit)
-                    )
-                    workers.append(w)
+                # The rate limit is per worker; one shared limiter enforces
+                # the aggregate rate of the active workers (only step_initial
+                # of them at first under step load; the ramp-up raises it)
+                active = self.config.step_initial if self.config.step_load else pool_size
+                rate_limiter = None
+                if self.config.rate_limit:
+                    interval_ns = 1e9 / self.config.rate_limit
+                    rate_limiter = RateLimiter(int(interval_ns / active), int(interval_ns))
                 
-                # Ramp-up function
-                async def ramp_up():
-                    nonlocal current_c
-                    while current_c < max_c:
-                        await asyncio.sleep(interval)
-                        add = min(increment, max_c - current_c)
-                        
-                        for _ in range(add):
-                            w = asyncio.create_task(
-                                worker(self, session, self.urls, self.config.method, 
-                                      request_queue, self.config.rate_limit)
-                            )
-                            workers.append(w)
-                        
-                        current_c += add
+                # Handle step load (ramp-up concurrency): start the full pool
+                # up front and gate it with a semaphore whose permits the
+                # ramp-up raises, rather than spawning workers as it goes
+                gate = None
+                if self.config.step_load:
+                    gate = asyncio.Semaphore(self.config.step_initial)
+                    spawn(self._ramp_up(stop_event, gate, rate_limiter))
                 
-                ramp_task = asyncio.create_task(ramp_up())
-            
-            else:
-                # Start all workers at once
-                for _ in range(self.config.concurrency):
-                    w = asyncio.create_task(
-                        worker(self, session, self.urls, self.config.method, 
-                              request_queue, self.config.rate_limit)
-                    )
-                    workers.append(w)
-            
-            # Wait for completion
-            if self.config.duration:
-                try:
-                    await asyncio.wait_for(asyncio.gather(*workers), timeout=self.config.duration)
-                except asyncio.TimeoutError:
-                    # Cancel workers when duration is reached
-                    for w in workers:
-                        w.cancel()
-                    await asyncio.gather(*workers, return_exceptions=True)
-            else:
-                await asyncio.gather(*workers)
-            
-            # Wait for queue to be processed
-            await request_queue.join()
+                # Resolve URL selection once: a single URL never changes,
+                # several are cycled round-robin across the whole pool
+                if len(self.urls) == 1:
+                    next_url = itertools.repeat(self.urls[0]).__next__
+                else:
+                    next_url = itertools.cycle(self.urls).__next__
+                
+                for _ in range(pool_size):
+                    spawn(worker(self, session, next_url, self.config.method, prepared,
+                                 request_ids, stop_event, rate_limiter, gate))
             
-            # Close progress bar
-            if pbar:
-                pbar.close()
+            # Wait for completion; workers exit on their own once the stop
+            # event is set, so no cancellation is needed on the normal path.
+            # A failing worker cancels the rest and its error is raised to the
+            # caller, the same way _wait_tasks does it
+            try:
+                if hasattr(asyncio, 'TaskGroup'):
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            start_tasks(tg.create_task)
+                    except BaseExceptionGroup as eg:
+                        raise eg.exceptions[0]
+                else:
+                    tasks = []
+                    start_tasks(lambda coro: tasks.append(asyncio.create_task(coro)))
+                    await self._wait_tasks(tasks, stop_event)
+            finally:
+                # Close progress bar, also when a worker failed
+                if pbar:
+                    self.flush_progress()
+                    pbar.close()
         
-        # Collect final timing statistics
-        if 'end' in trace_dns and 'start' in trace_dns:
-            self.dns_times.append(trace_dns['end'] - trace_dns['start'])
+        self.end_time = time.time()
+        self._trim_columns()
+    
+    async def _deadline(self, stop_event: asyncio.Event):
+        """
+        Set the stop event once the configured test duration has elapsed
         
-        if 'end' in trace_connect and 'start' in trace_connect:
-            self.connect_times.append(trace_connect['end'] - trace_connect['start'])
+        Args:
+            stop_event: Event shared with the workers
+        """
+        await asyncio.sleep(self.config.duration)
+        stop_event.set()
+    
+    async def _ramp_up(self, stop_event: asyncio.Event, gate: asyncio.Semaphore,
+                       rate_limiter: Optional[RateLimiter] = None):
+        """
+        Raise the number of active workers every step interval until the
+        maximum concurrency is reached
         
-        self.end_time = time.time()
+        Args:
+            stop_event: Event shared with the workers; ends the ramp-up early
+            gate: Semaphore limiting how many workers may have a request in flight
+            rate_limiter: Shared rate limiter whose aggregate rate follows the
+                number of active workers (None if unlimited)
+        """
+        current_c = self.config.step_initial
+        max_c = self.config.step_max or self.config.concurrency
+        
+        # Wait on the stop event with a timeout instead of wait_for(), so each
+        # step doesn't raise and unwind a TimeoutError
+        stopped = asyncio.ensure_future(stop_event.wait())
+        try:
+            while current_c < max_c:
+                done, _ = await asyncio.wait({stopped}, timeout=self.config.step_interval)
+                if done:
+                    return
+                
+                add = min(self.config.step_increment, max_c - current_c)
+                for _ in range(add):
+                    gate.release()
+                current_c += add
+                if rate_limiter is not None:
+                    rate_limiter.interval_ns = int(1e9 / self.config.rate_limit / current_c)
+        finally:
+            stopped.cancel()
+    
+    @staticmethod
+    async def _wait_tasks(tasks: list, stop_event: asyncio.Event):
+        """
+        Wait for all tasks to finish (fallback for Python < 3.11)
+        
+        Mirrors asyncio.TaskGroup: if any task fails, the remaining tasks are
+        cancelled and the exception is re-raised.
+        
+        Args:
+            tasks: Tasks to wait for
+            stop_event: Event shared with the workers
+        """
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                stop_event.set()
+                for other in pending:
+                    other.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise task.exception()
     
     def generate_statistics(self) -> Dict:
         """
@@ -230,68 +525,79 @@ class StressTester:
         Returns:
             Dictionary containing all test statistics
         """
-        if not self.results:
+        total = self._count
+        if not total:
             return {}
         
+        # Zero-copy views over the result columns
+        rt_us, status, size, err_idx = self._columns()
+        
         # Separate successful and failed requests
-        successful_requests = [r for r in self.results if r.error is None]
-        failed_requests = [r for r in self.results if r.error is not None]
-        response_times = [r.response_time for r in successful_requests]
-        response_sizes = self.response_sizes
+        ok = err_idx < 0
+        rt_ok = rt_us[ok] / 1e6
+        successful = int(np.count_nonzero(ok))
+        failed = total - successful
+        
+        # Sizes of every request that got an HTTP response (status 0 marks a
+        # connection-level failure with no body)
+        response_sizes = size[status > 0]
         
         # Basic statistics
         stats = {
-            'total_requests': len(self.results),
-            'successful_requests': len(successful_requests),
-            'failed_requests': len(failed_requests),
-            'success_rate': len(successful_requests) / len(self.results) * 100 if self.results else 0,
+            'total_requests': total,
+            'successful_requests': successful,
+            'failed_requests': failed,
+            'success_rate': successful / total * 100,
             'total_duration': self.end_time - self.start_time if self.end_time and self.start_time else 0,
-            'requests_per_second': len(self.results) / (self.end_time - self.start_time) if self.end_time and self.start_time else 0,
-            'throughput_bytes_per_sec': sum(response_sizes) / (self.end_time - self.start_time) if response_sizes and self.end_time and self.start_time else 0,
+            'requests_per_second': total / (self.end_time - self.start_time) if self.end_time and self.start_time else 0,
+            'throughput_bytes_per_sec': int(response_sizes.sum()) / (self.end_time - self.start_time) if response_sizes.size and self.end_time and self.start_time else 0,
         }
         
         # Response time statistics
-        if response_times:
+        if successful:
+            # One partition-based pass for every percentile, the median included
+            p25, p50, p75, p90, p95, p99 = np.percentile(rt_ok, [25, 50, 75, 90, 95, 99]).tolist()
             stats.update({
-                'min_response_time': min(response_times),
-                'max_response_time': max(response_times),
-                'mean_response_time': statistics.mean(response_times),
-                'median_response_time': statistics.median(response_times),
-                'std_response_time': statistics.stdev(response_times) if len(response_times) > 1 else 0,
-                'p25_response_time': statistics.quantiles(response_times, n=4)[0] if len(response_times) > 3 else response_times[0],
-                'p50_response_time': statistics.quantiles(response_times, n=2)[0] if len(response_times) > 1 else response_times[0],
-                'p75_response_time': statistics.quantiles(response_times, n=4)[2] if len(response_times) > 3 else response_times[-1],
-                'p90_response_time': statistics.quantiles(response_times, n=10)[8] if len(response_times) > 9 else max(response_times),
-                'p95_response_time': statistics.quantiles(response_times, n=20)[18] if len(response_times) > 19 else max(response_times),
-                'p99_response_time': statistics.quantiles(response_times, n=100)[98] if len(response_times) > 99 else max(response_times),
+                'min_response_time': float(rt_ok.min()),
+                'max_response_time': float(rt_ok.max()),
+                'mean_response_time': float(rt_ok.mean()),
+                'median_response_time': p50,
+                'std_response_time': float(rt_ok.std(ddof=1)) if successful > 1 else 0,
+                'p25_response_time': p25,
+                'p50_response_time': p50,
+                'p75_response_time': p75,
+                'p90_response_time': p90,
+                'p95_response_time': p95,
+                'p99_response_time': p99,
             })
         
         # Status code distribution
-        status_codes = {}
-        for result in successful_requests:
-            status_codes[result.status_code] = status_codes.get(result.status_code, 0) + 1
-        stats['status_code_distribution'] = status_codes
+        status_counts = np.bincount(status[ok])
+        status_codes = np.flatnonzero(status_counts)
+        stats['status_code_distribution'] = dict(zip(status_codes.tolist(), status_counts[status_codes].tolist()))
         
         # Error distribution
-        error_types = {}
-        for result in failed_requests:
-            error_types[result.error] = error_types.get(result.error, 0) + 1
-        stats['error_distribution'] = error_types
+        # Error IDs are assigned in order of first occurrence, so counting by ID
+        # keeps the original ordering of the distribution
+        error_counts = np.bincount(err_idx[~ok], minlength=len(self._errors))
+        stats['error_distribution'] = dict(zip(self._errors, error_counts.tolist()))
         
         # Response size statistics
-        if response_sizes:
-            stats['min_response_size'] = min(response_sizes)
-            stats['max_response_size'] = max(response_sizes)
-            stats['mean_response_size'] = statistics.mean(response_sizes)
-            stats['median_response_size'] = statistics.median(response_sizes)
+        if response_sizes.size:
+            stats['min_response_size'] = int(response_sizes.min())
+            stats['max_response_size'] = int(response_sizes.max())
+            stats['mean_response_size'] = float(response_sizes.mean())
+            stats['median_response_size'] = float(np.median(response_sizes))
         
         # DNS and connection time statistics
         if self.dns_times:
-            stats['mean_dns_time'] = statistics.mean(self.dns_times)
-            stats['max_dns_time'] = max(self.dns_times)
+            dns_times = np.frombuffer(self.dns_times, dtype=np.float64)
+            stats['mean_dns_time'] = float(dns_times.mean())
+            stats['max_dns_time'] = float(dns_times.max())
         
         if self.connect_times:
-            stats['mean_connect_time'] = statistics.mean(self.connect_times)
-            stats['max_connect_time'] = max(self.connect_times)
+            connect_times = np.frombuffer(self.connect_times, dtype=np.float64)
+            stats['mean_connect_time'] = float(connect_times.mean())
+            stats['max_connect_time'] = float(connect_times.max())
         
         return stats 
\ No newline at end of file
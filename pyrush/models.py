@@ -2,14 +2,16 @@
 Data models for PyRush stress testing application
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-@dataclass
-class RequestResult:
+class RequestResult(NamedTuple):
     """
     Represents the result of a single HTTP request
     
+    Results are immutable tuples without a per-instance __dict__, which keeps
+    memory and construction cost low when millions of requests are recorded.
+    
     Attributes:
         url: The URL that was requested
         method: HTTP method used (GET, POST, etc.)
@@ -52,6 +54,19 @@ class TestConfig:
         disable_keepalive: Disable HTTP keep-alive
         disable_redirects: Disable following redirects
         cpus: Number of CPU cores to use
+        assert_status: Expected status code (None to skip the check)
+        assert_body_contains: Text the response body must contain (None to skip the check)
+        assert_max_rt: Maximum response time in seconds (None to skip the check)
+        step_load: Whether to ramp up concurrency in steps
+        step_initial: Initial concurrency for step load
+        step_max: Maximum concurrency for step load
+        step_interval: Seconds between step load increments
+        step_increment: Workers added at each step
+        form: Form fields as FIELD=VALUE strings (sent as multipart/form-data)
+        form_file: File uploads as FIELD=PATH strings
+        max_stored_results: Maximum number of per-request results kept for
+            exports and report tables (None to keep all); statistics always
+            cover every request
     """
     url: str
     method: str
@@ -71,4 +86,15 @@ class TestConfig:
     disable_compression: bool
     disable_keepalive: bool
     disable_redirects: bool
-    cpus: int 
\ No newline at end of file
+    cpus: int
+    assert_status: Optional[int] = None
+    assert_body_contains: Optional[str] = None
+    assert_max_rt: Optional[float] = None
+    step_load: bool = False
+    step_initial: int = 1
+    step_max: Optional[int] = None
+    step_interval: int = 10
+    step_increment: int = 1
+    form: List[str] = field(default_factory=list)
+    form_file: List[str] = field(default_factory=list)
+    max_stored_results: Optional[int] = None
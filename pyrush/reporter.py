@@ -3,18 +3,59 @@ Report generation for PyRush stress testing results
 """
 
 import csv
+import functools
+import itertools
 import json
 import os
-from datetime import datetime
+import time
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
 import io
 from .models import RequestResult
 
+# Report styles, built once and shared by every report
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=1
+)
+
+# Grey header row over a beige body (configuration, summary and error tables)
+_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+def _light_header_table_style(font_size: int) -> TableStyle:
+    """Beige header row with the given header font size"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.beige),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), font_size),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+_STATUS_TABLE_STYLE = _light_header_table_style(12)
+_SLOWEST_TABLE_STYLE = _light_header_table_style(10)
+_SAMPLE_TABLE_STYLE = _light_header_table_style(8)
+
 def export_csv(tester, filename: str):
     """
     Export test results to CSV file
@@ -23,23 +64,57 @@ def export_csv(tester, filename: str):
         tester: StressTester instance containing results
         filename: Output CSV filename
     """
-    with open(filename, 'w', newline='') as csvfile:
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
         fieldnames = ['timestamp', 'url', 'method', 'status_code', 'response_time', 'response_size', 'error']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (r.timestamp, r.url, r.method, r.status_code, r.response_time, r.response_size, r.error or '')
+            for r in tester.results
+        )
+
+def _json_encoders(backend: str):
+    """
+    Get the JSON encoders for the requested backend
+    
+    Args:
+        backend: JSON encoder to use, 'stdlib' or 'orjson'
+        
+    Returns:
+        Tuple of (compact, indented) functions encoding an object to bytes
         
-        for result in tester.results:
-            writer.writerow({
-                'timestamp': result.timestamp,
-                'url': result.url,
-                'method': result.method,
-                'status_code': result.status_code,
-                'response_time': result.response_time,
-                'response_size': result.response_size,
-                'error': result.error or ''
-            })
+    Raises:
+        ValueError: If the orjson backend is requested but not installed
+    """
+    if backend == 'orjson':
+        try:
+            import orjson
+        except ImportError:
+            raise ValueError("orjson is not installed (pip install orjson)")
+        
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return (functools.partial(orjson.dumps, option=options),
+                functools.partial(orjson.dumps, option=options | orjson.OPT_INDENT_2))
+    
+    encode = json.JSONEncoder().encode
+    return (lambda obj: encode(obj).encode(),
+            lambda obj: json.dumps(obj, indent=2).encode())
 
-def export_json(tester, filename: str, stats: dict):
+def _encoded_results(tester, dumps):
+    """Lazily encode each stored result as a JSON object"""
+    return (
+        dumps({
+            'timestamp': r.timestamp,
+            'url': r.url,
+            'method': r.method,
+            'status_code': r.status_code,
+            'response_time': r.response_time,
+            'response_size': r.response_size,
+            'error': r.error
+        }) for r in tester.results
+    )
+
+def export_json(tester, filename: str, stats: dict, backend: str = 'stdlib'):
     """
     Export test results to JSON file
     
@@ -47,24 +122,55 @@ def export_json(tester, filename: str, stats: dict):
         tester: StressTester instance containing results
         filename: Output JSON filename
         stats: Statistics dictionary
+        backend: JSON encoder to use, 'stdlib' or 'orjson'
+        
+    Raises:
+        ValueError: If the orjson backend is requested but not installed
     """
-    data = {
-        'summary': stats,
-        'results': [
-            {
-                'timestamp': r.timestamp,
-                'url': r.url,
-                'method': r.method,
-                'status_code': r.status_code,
-                'response_time': r.response_time,
-                'response_size': r.response_size,
-                'error': r.error
-            } for r in tester.results
-        ]
-    }
+    dumps, dumps_indented = _json_encoders(backend)
+    
+    # Stream the results one row at a time instead of building the whole
+    # document in memory first
+    rows = _encoded_results(tester, dumps)
     
-    with open(filename, 'w') as fjson:
-        json.dump(data, fjson, indent=2)
+    with open(filename, 'wb') as fjson:
+        fjson.write(b'{\n"summary": ')
+        fjson.write(dumps_indented(stats))
+        fjson.write(b',\n"results": [\n')
+        separator = b''
+        while True:
+            chunk = list(itertools.islice(rows, 10000))
+            if not chunk:
+                break
+            fjson.write(separator)
+            fjson.write(b',\n'.join(chunk))
+            separator = b',\n'
+        fjson.write(b'\n]\n}\n')
+
+def export_jsonl(tester, filename: str, stats: dict, backend: str = 'stdlib'):
+    """
+    Export test results to a JSON Lines file
+    
+    The first line holds the summary statistics and every following line one
+    request result, so consumers can read the file lazily line by line.
+    
+    Args:
+        tester: StressTester instance containing results
+        filename: Output JSONL filename
+        stats: Statistics dictionary
+        backend: JSON encoder to use, 'stdlib' or 'orjson'
+        
+    Raises:
+        ValueError: If the orjson backend is requested but not installed
+    """
+    dumps, _ = _json_encoders(backend)
+    
+    with open(filename, 'wb', buffering=1 << 20) as fjsonl:
+        fjsonl.write(dumps({'summary': stats}))
+        fjsonl.write(b'\n')
+        for row in _encoded_results(tester, dumps):
+            fjsonl.write(row)
+            fjsonl.write(b'\n')
 
 def generate_pdf_report(tester, filename: str):
     """
@@ -76,31 +182,21 @@ def generate_pdf_report(tester, filename: str):
     """
     doc = SimpleDocTemplate(filename, pagesize=A4)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=1
-    )
     
     # Add title
-    story.append(Paragraph("PyRush Stress Test Report", title_style))
+    story.append(Paragraph("PyRush Stress Test Report", _TITLE_STYLE))
     story.append(Spacer(1, 20))
     
     # Add start and end times
     if tester.start_time and tester.end_time:
-        waktu_mulai = datetime.fromtimestamp(tester.start_time).strftime('%Y-%m-%d %H:%M:%S')
-        waktu_selesai = datetime.fromtimestamp(tester.end_time).strftime('%Y-%m-%d %H:%M:%S')
-        story.append(Paragraph(f"Start Time: {waktu_mulai}", styles['Normal']))
-        story.append(Paragraph(f"End Time: {waktu_selesai}", styles['Normal']))
+        waktu_mulai = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(tester.start_time))
+        waktu_selesai = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(tester.end_time))
+        story.append(Paragraph(f"Start Time: {waktu_mulai}", _STYLES['Normal']))
+        story.append(Paragraph(f"End Time: {waktu_selesai}", _STYLES['Normal']))
         story.append(Spacer(1, 10))
     
     # Add test configuration
-    story.append(Paragraph("Test Configuration", styles['Heading2']))
+    story.append(Paragraph("Test Configuration", _STYLES['Heading2']))
     config_data = [
         ['Parameter', 'Value'],
         ['URLs', ', '.join(tester.urls)],
@@ -121,23 +217,14 @@ def generate_pdf_report(tester, filename: str):
         config_data.append(['Host Header', tester.config.host])
     
     config_table = Table(config_data, colWidths=[2*inch, 4*inch])
-    config_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    config_table.setStyle(_HEADER_TABLE_STYLE)
     story.append(config_table)
     story.append(Spacer(1, 20))
     
     # Generate and add statistics
     stats = tester.generate_statistics()
     if stats:
-        story.append(Paragraph("Summary Statistics", styles['Heading2']))
+        story.append(Paragraph("Summary Statistics", _STYLES['Heading2']))
         summary_data = [
             ['Metric', 'Value'],
             ['Total Requests', str(stats['total_requests'])],
@@ -160,38 +247,33 @@ def generate_pdf_report(tester, filename: str):
             ])
         
         summary_table = Table(summary_data, colWidths=[2*inch, 4*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(_HEADER_TABLE_STYLE)
         story.append(summary_table)
         story.append(Spacer(1, 20))
         
         # Add response time histogram
-        if 'mean_response_time' in stats and tester.results:
-            response_times = [r.response_time for r in tester.results if r.error is None]
-            if response_times:
-                fig, ax = plt.subplots(figsize=(5, 2.5))
-                ax.hist(response_times, bins=20, color='#007acc', edgecolor='black')
+        if 'mean_response_time' in stats:
+            response_times = tester.successful_response_times()
+            if response_times.size:
+                counts, edges = np.histogram(response_times, bins=20)
+                # Draw on a standalone Agg figure; no pyplot global state
+                fig = Figure(figsize=(5, 2.5))
+                canvas = FigureCanvasAgg(fig)
+                ax = fig.subplots()
+                ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                       color='#007acc', edgecolor='black')
                 ax.set_title('Response Time Distribution (seconds)')
                 ax.set_xlabel('Response Time (s)')
                 ax.set_ylabel('Number of Requests')
-                plt.tight_layout()
+                fig.tight_layout()
                 
                 img_buf = io.BytesIO()
-                plt.savefig(img_buf, format='png')
-                plt.close(fig)
+                canvas.print_png(img_buf)
                 img_buf.seek(0)
                 
-                story.append(Paragraph("Response Time Distribution:", styles['Heading3']))
+                story.append(Paragraph("Response Time Distribution:", _STYLES['Heading3']))
                 story.append(Image(img_buf, width=5*inch, height=2.5*inch))
-                story.append(Paragraph("Chart showing the distribution of response times across all requests.", styles['Normal']))
+                story.append(Paragraph("Chart showing the distribution of response times across all requests.", _STYLES['Normal']))
                 story.append(Spacer(1, 20))
         
         # Add status code distribution
@@ -201,37 +283,23 @@ def generate_pdf_report(tester, filename: str):
                 status_data.append([str(status_code), str(count)])
             
             status_table = Table(status_data, colWidths=[2*inch, 4*inch])
-            status_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.beige),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(Paragraph("Status Code Distribution:", styles['Heading3']))
+            status_table.setStyle(_STATUS_TABLE_STYLE)
+            story.append(Paragraph("Status Code Distribution:", _STYLES['Heading3']))
             story.append(status_table)
             story.append(Spacer(1, 10))
         
         # Add 10 slowest requests
-        if tester.results:
-            slowest = sorted([r for r in tester.results if r.error is None], 
-                           key=lambda r: r.response_time, reverse=True)[:10]
-            if slowest:
-                slowest_data = [['#', 'URL', 'Status', 'Response Time (s)']]
-                for i, r in enumerate(slowest, 1):
-                    slowest_data.append([i, r.url, r.status_code, f"{r.response_time:.3f}"])
-                
-                slowest_table = Table(slowest_data, colWidths=[0.4*inch, 2.5*inch, 0.8*inch, 1.2*inch])
-                slowest_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.beige),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(Paragraph("10 Slowest Requests:", styles['Heading3']))
-                story.append(slowest_table)
-                story.append(Spacer(1, 10))
+        slowest = tester.slowest_requests()
+        if slowest:
+            slowest_data = [['#', 'URL', 'Status', 'Response Time (s)']]
+            for i, r in enumerate(slowest, 1):
+                slowest_data.append([i, r.url, r.status_code, f"{r.response_time:.3f}"])
+            
+            slowest_table = Table(slowest_data, colWidths=[0.4*inch, 2.5*inch, 0.8*inch, 1.2*inch])
+            slowest_table.setStyle(_SLOWEST_TABLE_STYLE)
+            story.append(Paragraph("10 Slowest Requests:", _STYLES['Heading3']))
+            story.append(slowest_table)
+            story.append(Spacer(1, 10))
         
         # Add error distribution
         if stats.get('error_distribution'):
@@ -240,17 +308,8 @@ def generate_pdf_report(tester, filename: str):
                 error_data.append([error_type[:50] + '...' if len(error_type) > 50 else error_type, str(count)])
             
             error_table = Table(error_data, colWidths=[4*inch, 2*inch])
-            error_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(Paragraph("Error Distribution:", styles['Heading3']))
+            error_table.setStyle(_HEADER_TABLE_STYLE)
+            story.append(Paragraph("Error Distribution:", _STYLES['Heading3']))
             story.append(error_table)
             story.append(Spacer(1, 10))
         
@@ -264,9 +323,9 @@ def generate_pdf_report(tester, filename: str):
             recommendations.append("Response size is very small, ensure API returns expected data.")
         
         if recommendations:
-            story.append(Paragraph("Recommendations:", styles['Heading2']))
+            story.append(Paragraph("Recommendations:", _STYLES['Heading2']))
             for rec in recommendations:
-                story.append(Paragraph(f"• {rec}", styles['Normal']))
+                story.append(Paragraph(f"• {rec}", _STYLES['Normal']))
             story.append(Spacer(1, 10))
         
         # Add sample request data
@@ -274,7 +333,7 @@ def generate_pdf_report(tester, filename: str):
             sample_data = [['Timestamp', 'URL', 'Status', 'Response Time (s)', 'Size', 'Error']]
             for r in tester.results[:20]:  # First 20 requests
                 sample_data.append([
-                    datetime.fromtimestamp(r.timestamp).strftime('%H:%M:%S'),
+                    time.strftime('%H:%M:%S', time.localtime(r.timestamp)),
                     r.url,
                     r.status_code,
                     f"{r.response_time:.3f}",
@@ -283,14 +342,8 @@ def generate_pdf_report(tester, filename: str):
                 ])
             
             sample_table = Table(sample_data, colWidths=[1*inch, 2*inch, 0.8*inch, 1*inch, 0.8*inch, 1.5*inch])
-            sample_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.beige),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(Paragraph("Sample Request Data (first 20 requests):", styles['Heading2']))
+            sample_table.setStyle(_SAMPLE_TABLE_STYLE)
+            story.append(Paragraph("Sample Request Data (first 20 requests):", _STYLES['Heading2']))
             story.append(sample_table)
             story.append(Spacer(1, 10))
     
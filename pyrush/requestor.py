@@ -4,12 +4,112 @@ HTTP request handling for PyRush stress testing
 
 import asyncio
 import aiohttp
+import io
+import mimetypes
+import os
 import time
-import ssl
-import certifi
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from .models import RequestResult
 
-async def make_request(tester, session: aiohttp.ClientSession, url: str, method: str) -> RequestResult:
+# Workers hand results to the tester in batches of up to this many results,
+# and at least this often so the progress bar keeps moving
+RESULT_BATCH_SIZE = 128
+RESULT_FLUSH_INTERVAL_NS = 100_000_000
+
+class PreparedRequest(NamedTuple):
+    """
+    Request options that stay the same for every request of a test
+    
+    Attributes:
+        kwargs: Keyword arguments passed to ClientSession.request
+        form_fields: Form fields as (name, value) pairs
+        form_files: File uploads as (name, filename, content type, content) tuples
+        body_needle: UTF-8 encoded --assert-body-contains text (None to skip the check)
+        wall_clock_offset: time.time() minus time.perf_counter(), to convert
+            perf_counter readings into wall clock timestamps
+        use_form: Whether requests are sent as multipart/form-data
+        assert_status: Expected status code (None to skip the check)
+        assert_max_rt: Maximum response time in seconds (None to skip the check)
+    """
+    kwargs: Dict[str, Any]
+    form_fields: List[Tuple[str, str]]
+    form_files: List[Tuple[str, str, str, bytes]]
+    body_needle: Optional[bytes]
+    wall_clock_offset: float
+    use_form: bool
+    assert_status: Optional[int]
+    assert_max_rt: Optional[float]
+
+def prepare_request(config) -> PreparedRequest:
+    """
+    Build the request options shared by all requests of a test
+    
+    Args:
+        config: Test configuration
+        
+    Returns:
+        PreparedRequest reused for every request of the test
+        
+    Raises:
+        OSError: If the request body file or an upload file cannot be read
+    """
+    headers = config.headers.copy()
+    kwargs = {
+        'timeout': aiohttp.ClientTimeout(total=config.timeout),
+        'headers': headers,
+        'allow_redirects': not config.disable_redirects
+    }
+    
+    # Ask for uncompressed responses when compression is disabled (the session
+    # then also skips decompression), unless an Accept-Encoding header is given
+    if config.disable_compression and not any(k.lower() == 'accept-encoding' for k in headers):
+        headers['Accept-Encoding'] = 'identity'
+    
+    # Parse multipart/form-data fields; the FormData itself is single-use and
+    # is built per request
+    form_fields = [tuple(f.split('=', 1)) for f in config.form if '=' in f]
+    
+    # Read upload files once; each request wraps the bytes in a fresh BytesIO
+    form_files = []
+    for f in config.form_file:
+        if '=' in f:
+            k, path = f.split('=', 1)
+            filename = os.path.basename(path)
+            content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            with open(path, 'rb') as upload:
+                form_files.append((k, filename, content_type, upload.read()))
+    use_form = bool(config.form or config.form_file)
+    
+    # Handle regular request body; the data file is read once per test. Form
+    # requests get their Content-Type, boundary included, from FormData
+    if not use_form:
+        if config.data:
+            kwargs['data'] = config.data
+        elif config.data_file:
+            with open(config.data_file, 'r') as f:
+                kwargs['data'] = f.read()
+    
+    # Add authentication
+    if config.auth:
+        kwargs['auth'] = aiohttp.BasicAuth(config.auth[0], config.auth[1])
+    
+    # Add proxy
+    if config.proxy:
+        kwargs['proxy'] = config.proxy
+    
+    # Add custom host header
+    if config.host:
+        headers['Host'] = config.host
+    
+    body_needle = config.assert_body_contains.encode() if config.assert_body_contains else None
+    
+    wall_clock_offset = time.time() - time.perf_counter_ns() / 1e9
+    
+    return PreparedRequest(kwargs, form_fields, form_files, body_needle, wall_clock_offset,
+                           use_form, config.assert_status, config.assert_max_rt)
+
+async def make_request(tester, session: aiohttp.ClientSession, url: str, method: str,
+                       prepared: PreparedRequest) -> RequestResult:
     """
     Make a single HTTP request and return the result
     
@@ -18,107 +118,64 @@ async def make_request(tester, session: aiohttp.ClientSession, url: str, method:
         session: aiohttp ClientSession for making requests
         url: URL to request
         method: HTTP method to use
+        prepared: Shared request options from prepare_request()
         
     Returns:
         RequestResult containing the response details
     """
-    start_time = time.time()
-    timestamp = start_time
-    dns_time = None
-    connect_time = None
+    # Elapsed time comes from the monotonic nanosecond clock, unaffected by
+    # wall clock adjustments; the wall clock timestamp is derived from the
+    # same reading instead of a separate time.time() call
+    start_ns = time.perf_counter_ns()
+    timestamp = prepared.wall_clock_offset + start_ns / 1e9
     
     try:
-        # Prepare request kwargs
-        kwargs = {
-            'timeout': aiohttp.ClientTimeout(total=tester.config.timeout),
-            'headers': tester.config.headers.copy(),
-            'allow_redirects': not tester.config.disable_redirects,
-            'compress': not tester.config.disable_compression
-        }
+        kwargs = prepared.kwargs
         
         # Handle multipart/form-data
-        use_form = hasattr(tester, 'form') and (tester.form or tester.form_file)
-        if use_form:
-            from aiohttp import FormData
-            form = FormData()
+        if prepared.use_form:
+            form = aiohttp.FormData()
             
             # Add form fields
-            for f in getattr(tester, 'form', []):
-                if '=' in f:
-                    k, v = f.split('=', 1)
-                    form.add_field(k, v)
+            for k, v in prepared.form_fields:
+                form.add_field(k, v)
             
             # Add file uploads
-            for f in getattr(tester, 'form_file', []):
-                if '=' in f:
-                    k, path = f.split('=', 1)
-                    try:
-                        form.add_field(k, open(path, 'rb'))
-                    except Exception as e:
-                        return RequestResult(
-                            url=url, 
-                            method=method, 
-                            status_code=0, 
-                            response_time=0, 
-                            timestamp=timestamp, 
-                            error=f"File error: {e}"
-                        )
-            
-            kwargs['data'] = form
+            for k, filename, content_type, content in prepared.form_files:
+                form.add_field(k, io.BytesIO(content), filename=filename, content_type=content_type)
             
-            # Set content-type if not already set
-            if 'Content-Type' not in kwargs['headers']:
-                kwargs['headers']['Content-Type'] = 'multipart/form-data'
-        
-        # Handle regular request body
-        elif tester.config.data:
-            kwargs['data'] = tester.config.data
-        elif tester.config.data_file:
-            with open(tester.config.data_file, 'r') as f:
-                kwargs['data'] = f.read()
-        
-        # Add authentication
-        if tester.config.auth:
-            kwargs['auth'] = aiohttp.BasicAuth(tester.config.auth[0], tester.config.auth[1])
-        
-        # Add proxy
-        if tester.config.proxy:
-            kwargs['proxy'] = tester.config.proxy
-        
-        # Add custom host header
-        if tester.config.host:
-            kwargs['headers']['Host'] = tester.config.host
+            kwargs = dict(kwargs, data=form)
         
         # Make the request
         async with session.request(method, url, **kwargs) as response:
-            response_data = await response.read()
-            response_time = time.time() - start_time
+            # Drain the body chunk by chunk (keeping the connection reusable)
+            # and count bytes; the body assertion is checked on the raw bytes
+            # as they arrive, carrying over enough of the previous chunk to
+            # match a needle that spans two chunks
+            needle = prepared.body_needle
+            found = needle is None
+            tail = b''
+            response_size = 0
+            async for chunk in response.content.iter_any():
+                response_size += len(chunk)
+                if not found:
+                    window = tail + chunk
+                    found = needle in window
+                    tail = window[-(len(needle) - 1):] if len(needle) > 1 else b''
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
             error = None
             
             # Check custom assertions
-            if hasattr(tester, 'assert_status') and tester.assert_status is not None:
-                if response.status != tester.assert_status:
-                    error = f"Assert status {tester.assert_status} failed (got {response.status})"
+            assert_status = prepared.assert_status
+            if assert_status is not None and response.status != assert_status:
+                error = f"Assert status {assert_status} failed (got {response.status})"
             
-            if hasattr(tester, 'assert_body_contains') and tester.assert_body_contains:
-                try:
-                    body_str = response_data.decode(errors='ignore')
-                    if tester.assert_body_contains not in body_str:
-                        error = f"Assert body contains '{tester.assert_body_contains}' failed"
-                except Exception:
-                    error = f"Assert body contains '{tester.assert_body_contains}' failed (decode error)"
+            if not found:
+                error = f"Assert body contains '{needle.decode()}' failed"
             
-            if hasattr(tester, 'assert_max_rt') and tester.assert_max_rt is not None:
-                if response_time > tester.assert_max_rt:
-                    error = f"Assert max response time {tester.assert_max_rt}s failed (got {response_time:.3f}s)"
-            
-            # Update statistics
-            with tester.lock:
-                if dns_time is not None:
-                    tester.dns_times.append(dns_time)
-                if connect_time is not None:
-                    tester.connect_times.append(connect_time)
-                tester.response_sizes.append(len(response_data))
+            assert_max_rt = prepared.assert_max_rt
+            if assert_max_rt is not None and response_time > assert_max_rt:
+                error = f"Assert max response time {assert_max_rt}s failed (got {response_time:.3f}s)"
             
             return RequestResult(
                 url=url,
@@ -127,11 +184,11 @@ async def make_request(tester, session: aiohttp.ClientSession, url: str, method:
                 response_time=response_time,
                 timestamp=timestamp,
                 error=error,
-                response_size=len(response_data)
+                response_size=response_size
             )
     
     except Exception as e:
-        response_time = time.time() - start_time
+        response_time = (time.perf_counter_ns() - start_ns) / 1e9
         return RequestResult(
             url=url,
             method=method,
@@ -141,52 +198,109 @@ async def make_request(tester, session: aiohttp.ClientSession, url: str, method:
             error=str(e)
         )
 
-async def worker(tester, session: aiohttp.ClientSession, urls: list, method: str, 
-                request_queue: asyncio.Queue, rate_limit):
+class RateLimiter:
+    """
+    Rate limiter shared by all workers of a test
+    
+    Uses GCRA: a single theoretical arrival time (TAT) is advanced by one
+    emission interval per request, and a request only waits when it would
+    arrive earlier than the burst tolerance allows. No timer task is needed
+    and the aggregate rate holds regardless of how many workers share it.
+    """
+    
+    def __init__(self, interval_ns: int, burst_ns: int):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            interval_ns: Emission interval between requests in nanoseconds
+            burst_ns: Burst tolerance in nanoseconds
+        """
+        self.interval_ns = interval_ns
+        self.burst_ns = burst_ns
+        self._tat = 0
+    
+    def reserve(self) -> float:
+        """
+        Reserve the next request slot
+        
+        Returns:
+            Seconds to wait before sending the request (0 or less to send now)
+        """
+        now = time.monotonic_ns()
+        tat = self._tat if self._tat > now else now
+        self._tat = tat + self.interval_ns
+        return (tat - self.burst_ns - now) / 1e9
+
+async def worker(tester, session: aiohttp.ClientSession, next_url: Callable[[], str], method: str,
+                 prepared: PreparedRequest, request_ids: Iterator[int], stop_event: asyncio.Event,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 gate: Optional[asyncio.Semaphore] = None):
     """
-    Worker function that processes requests from the queue
+    Worker function that claims request IDs from a shared iterator
+    
+    Workers stop when the stop event is set or when the request IDs run out.
+    The worker that exhausts the iterator sets the stop event so the remaining
+    workers (and any step load ramp-up) stop as well. Results are buffered per
+    worker and recorded on the tester in batches. Request failures are
+    recorded as results by make_request; any other exception is a bug and
+    propagates to run_test.
     
     Args:
         tester: StressTester instance
         session: aiohttp ClientSession
-        urls: List of URLs to cycle through
+        next_url: Callable returning the URL for the next request, shared by all workers
         method: HTTP method to use
-        request_queue: Queue containing request IDs
-        rate_limit: Rate limit per worker (requests per second)
+        prepared: Shared request options from prepare_request()
+        request_ids: Shared iterator yielding request IDs
+        stop_event: Event signalling that no further requests should be started
+        rate_limiter: Optional rate limiter shared by all workers
+        gate: Optional semaphore bounding how many workers run at once (step load)
     """
-    url_count = len(urls)
+    pending: List[RequestResult] = []
+    last_flush_ns = time.perf_counter_ns()
     
-    while True:
-        try:
-            # Get request ID from queue
-            request_id = await asyncio.wait_for(request_queue.get(), timeout=1.0)
-            
-            # None indicates worker should stop
-            if request_id is None:
-                break
-            
-            # Apply rate limiting
-            if rate_limit:
-                await asyncio.sleep(1.0 / rate_limit)
-            
-            # Select URL (round-robin)
-            url = urls[request_id % url_count]
-            
-            # Make the request
-            result = await make_request(tester, session, url, method)
-            
-            # Store result and update progress
-            with tester.lock:
-                tester.results.append(result)
-                tester.update_progress()
-                
-        except asyncio.TimeoutError:
-            break
-        except Exception as e:
-            print(f"[WORKER ERROR] {e}")
-            break
-        finally:
+    def flush():
+        with tester.lock:
+            tester.record_results(pending)
+        pending.clear()
+    
+    try:
+        while not stop_event.is_set():
+            if gate is not None:
+                await gate.acquire()
             try:
-                request_queue.task_done()
-            except Exception:
-                pass 
\ No newline at end of file
+                # The stop event may have been set while waiting for the gate
+                if stop_event.is_set():
+                    break
+                
+                # Apply rate limiting before claiming a request ID, so a claimed
+                # ID is always sent even if the stop event is set meanwhile
+                if rate_limiter is not None:
+                    delay = rate_limiter.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                        if stop_event.is_set():
+                            break
+                
+                # Claim the next request ID
+                if next(request_ids, None) is None:
+                    stop_event.set()
+                    break
+                
+                # Make the request
+                result = await make_request(tester, session, next_url(), method, prepared)
+                
+                # Collect results locally and hand them to the tester in
+                # batches, taking the shared lock once per batch
+                pending.append(result)
+                now_ns = time.perf_counter_ns()
+                if len(pending) >= RESULT_BATCH_SIZE or now_ns - last_flush_ns >= RESULT_FLUSH_INTERVAL_NS:
+                    flush()
+                    last_flush_ns = now_ns
+            finally:
+                if gate is not None:
+                    gate.release()
+    finally:
+        if pending:
+            flush()
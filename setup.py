@@ -31,11 +31,15 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "aiohttp>=3.8.0",
+        # speedups pulls in aiodns and brotli for the C-accelerated client paths
+        "aiohttp[speedups]>=3.8.0",
         "tqdm>=4.64.0",
         "reportlab>=3.6.0",
         "matplotlib>=3.5.0",
         "certifi>=2022.0.0",
+        "numpy>=1.21.0",
+        # libuv-based event loop; not available on Windows or PyPy
+        "uvloop>=0.17.0; sys_platform != 'win32' and platform_python_implementation == 'CPython'",
     ],
     entry_points={
         "console_scripts": [